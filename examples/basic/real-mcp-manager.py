@@ -6,15 +6,43 @@ Replaces the mock MCP Manager with live AI-powered content creation
 """
 
 import http.server
-import socketserver
 import json
 import requests
 import logging
 import os
+import signal
+import socket
+import sys
+import threading
 import time
 from urllib.parse import urlparse, parse_qs
 from datetime import datetime
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; stdlib json handles the routed payloads too
+    _json_loads = json.loads
+
+    def _json_dumps(data):
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+_TS_CACHE = (0, '')
+
+def _now_iso_z():
+    """UTC time for result and health timestamps, formatted at most once per second"""
+    global _TS_CACHE
+    now = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] != now:
+        cached = (now, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)))
+        _TS_CACHE = cached
+    return cached[1]
 
 # Configure logging
 logging.basicConfig(
@@ -23,9 +51,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger('real-mcp-manager')
 
+# Shared keep-alive pool so MCP calls reuse connections. MCP calls run
+# workflows, so a POST is only retried on 429/503 (the service did not
+# take the request) and never after a read timeout
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, read=False, backoff_factor=0.2,
+                      status_forcelist=[429, 503],
+                      allowed_methods=frozenset({'GET', 'POST'}),
+                      raise_on_status=False)
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+# Health probes keep their own pool with no retries, so a hung service
+# costs one probe timeout rather than three
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+
+# Recent health probe results: url -> (monotonic time, healthy), plus the
+# probes in progress: url -> Event set when that probe finishes
+_HEALTH_TTL = float(os.getenv('MCP_HEALTH_TTL', 2.0))
+_HEALTH_CACHE = {}
+_HEALTH_PROBING = {}
+_HEALTH_LOCK = threading.Lock()
+
+# Fans out health probes so listing N services costs one probe latency
+_PROBE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mcp-probe')
+
+# Largest accepted POST body
+_MAX_BODY = 1 << 20  # 1 MiB
+
 class RealMCPHandler(http.server.BaseHTTPRequestHandler):
     """HTTP handler for Real MCP Manager"""
 
+    # Socket timeout for slow or stalled clients
+    timeout = 10
+
     # MCP Services configuration
     MCP_SERVICES = {
         'content_generation': 'http://localhost:8804',
@@ -33,41 +97,61 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
         'image_generation': 'http://localhost:8806',
     }
 
+    # Services advertised by GET /services
+    LISTED_SERVICES = [
+        {
+            'name': 'demo-content-mcp',
+            'url': 'http://localhost:8804',
+            'type': 'content_generation',
+            'capabilities': ['blog_posts', 'articles', 'seo_content']
+        },
+    ]
+
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
         self.send_response(200)
         self._set_cors_headers()
         self.end_headers()
 
+    # Route tables: exact path -> handler method name
+    _GET_ROUTES = {
+        '/health': '_handle_health',
+        '/services': '_handle_services_list',
+    }
+    _POST_ROUTES = {
+        '/generate/content': '_handle_content_generation',
+        '/generate/blog': '_handle_blog_generation',
+        '/process/text': '_handle_text_processing',
+    }
+
     def do_GET(self):
         """Handle GET requests"""
-        if self.path == '/health':
-            self._handle_health()
-        elif self.path == '/services':
-            self._handle_services_list()
-        elif self.path.startswith('/services/'):
-            self._handle_service_status()
-        else:
-            self._handle_default_get()
+        handler = self._GET_ROUTES.get(self.path)
+        if handler is None:
+            handler = '_handle_service_status' if self.path.startswith('/services/') else '_handle_default_get'
+        getattr(self, handler)()
 
     def do_POST(self):
         """Handle POST requests for content generation"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
+            length_header = self.headers.get('Content-Length', '0')
+            if not (length_header.isascii() and length_header.isdigit()):
+                # Negative or malformed: refuse it rather than guess at the body
+                self._send_error_response(400, "Invalid Content-Length")
+                return
+            content_length = int(length_header)
+            if content_length > _MAX_BODY:
+                self._send_error_response(413, f"Payload too large (limit {_MAX_BODY} bytes)")
+                return
             post_data = self.rfile.read(content_length)
-            request_data = json.loads(post_data.decode('utf-8'))
+            request_data = _json_loads(post_data)
 
-            logger.info(f"Received request: {self.path}")
-            logger.info(f"Request data: {json.dumps(request_data, indent=2)}")
+            logger.info("Received request: %s", self.path)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request data: %s", _json_dumps(request_data).decode('utf-8'))
 
-            if self.path == '/generate/content':
-                self._handle_content_generation(request_data)
-            elif self.path == '/generate/blog':
-                self._handle_blog_generation(request_data)
-            elif self.path == '/process/text':
-                self._handle_text_processing(request_data)
-            else:
-                self._handle_generic_request(request_data)
+            handler = self._POST_ROUTES.get(self.path, '_handle_generic_request')
+            getattr(self, handler)(request_data)
 
         except Exception as e:
             logger.error(f"Error handling POST request: {str(e)}")
@@ -83,7 +167,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
                 'status': 'healthy',
                 'service': 'mcp-manager-real',
                 'version': '1.0.0',
-                'timestamp': datetime.utcnow().isoformat() + 'Z',
+                'timestamp': _now_iso_z(),
                 'mcp_services': {
                     'demo_content_mcp': {
                         'url': 'http://localhost:8804',
@@ -116,7 +200,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
                 'prompt': intent,
                 'type': content_type,
                 'user_id': user_id,
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': _now_iso_z()
             }
 
             # Call demo-content-mcp service
@@ -135,7 +219,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
                         'word_count': response.get('word_count', 500),
                         'execution_time_ms': response.get('execution_time_ms', 2000),
                         'model_used': 'gemini-1.5-flash',
-                        'generated_at': datetime.utcnow().isoformat() + 'Z',
+                        'generated_at': _now_iso_z(),
                         'real_ai_content': True
                     },
                     'metadata': {
@@ -169,7 +253,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
                 'enhanced': True,
                 'include_seo': True,
                 'target_length': 800,
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': _now_iso_z()
             }
 
             response = self._call_mcp_service('http://localhost:8804/generate/blog', mcp_request)
@@ -187,7 +271,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
                             'word_count': response.get('word_count', 847),
                             'reading_time': response.get('reading_time', 4),
                             'seo_keywords': response.get('keywords', ['AI', 'automation', 'technology']),
-                            'generated_at': datetime.utcnow().isoformat() + 'Z'
+                            'generated_at': _now_iso_z()
                         },
                         'quality_scores': {
                             'overall_score': response.get('quality_score', 4.8),
@@ -214,7 +298,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
         try:
             logger.info(f"Calling MCP service: {url}")
 
-            response = requests.post(
+            response = _SESSION.post(
                 url,
                 json=data,
                 headers={'Content-Type': 'application/json'},
@@ -222,7 +306,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 logger.info("✅ MCP service call successful")
                 return result
             else:
@@ -237,12 +321,45 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
             return None
 
     def _check_service_health(self, url):
-        """Check if a service is healthy"""
+        """Check if a service is healthy, reusing probes newer than _HEALTH_TTL
+
+        Only one thread probes an expired service at a time; the others get
+        the last known result, or wait for the first probe to finish.
+        """
+        hit = _HEALTH_CACHE.get(url)
+        if hit and time.monotonic() - hit[0] < _HEALTH_TTL:
+            return hit[1]
+
+        with _HEALTH_LOCK:
+            hit = _HEALTH_CACHE.get(url)
+            if hit and time.monotonic() - hit[0] < _HEALTH_TTL:
+                return hit[1]
+            done = _HEALTH_PROBING.get(url)
+            if done is None:
+                done = _HEALTH_PROBING[url] = threading.Event()
+                probing = True
+            else:
+                probing = False
+
+        if not probing:
+            if hit:
+                return hit[1]
+            done.wait()
+            return _HEALTH_CACHE[url][1]
+
         try:
-            response = requests.get(f"{url}/health", timeout=5)
-            return response.status_code == 200
-        except:
-            return False
+            try:
+                response = _PROBE_SESSION.get(f"{url}/health", timeout=5)
+                healthy = response.status_code == 200
+            except:
+                healthy = False
+            # Stamp the result when the probe finished, not when it started
+            _HEALTH_CACHE[url] = (time.monotonic(), healthy)
+        finally:
+            with _HEALTH_LOCK:
+                del _HEALTH_PROBING[url]
+            done.set()
+        return healthy
 
     def _send_fallback_response(self, request_data):
         """Send fallback response when MCP services are unavailable"""
@@ -268,18 +385,22 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
 
     def _handle_services_list(self):
         """List available MCP services"""
+        urls = [svc['url'] for svc in self.LISTED_SERVICES]
+        results = dict(zip(urls, _PROBE_POOL.map(self._check_service_health, urls)))
+
         services_data = {
             'services': [
                 {
-                    'name': 'demo-content-mcp',
-                    'url': 'http://localhost:8804',
-                    'type': 'content_generation',
-                    'status': 'healthy' if self._check_service_health('http://localhost:8804') else 'unhealthy',
-                    'capabilities': ['blog_posts', 'articles', 'seo_content']
+                    'name': svc['name'],
+                    'url': svc['url'],
+                    'type': svc['type'],
+                    'status': 'healthy' if results[svc['url']] else 'unhealthy',
+                    'capabilities': svc['capabilities']
                 }
+                for svc in self.LISTED_SERVICES
             ],
-            'total_services': 1,
-            'healthy_services': sum(1 for s in [self._check_service_health('http://localhost:8804')] if s)
+            'total_services': len(self.LISTED_SERVICES),
+            'healthy_services': sum(1 for healthy in results.values() if healthy)
         }
 
         self._send_json_response(services_data)
@@ -294,8 +415,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
         self._set_cors_headers()
         self.send_header('Content-Type', 'application/json')
         self.end_headers()
-        response_json = json.dumps(data, indent=2)
-        self.wfile.write(response_json.encode('utf-8'))
+        self.wfile.write(_json_dumps(data))
 
     def _send_error_response(self, status_code, message):
         """Send error response"""
@@ -303,7 +423,7 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
             'error': True,
             'message': message,
             'status_code': status_code,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': _now_iso_z()
         }
         self._send_json_response(error_data, status_code)
 
@@ -335,10 +455,70 @@ class RealMCPHandler(http.server.BaseHTTPRequestHandler):
         """Override to use our logger"""
         logger.info(format % args)
 
+class ReusePortHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server whose port can be shared by sibling workers
+
+    SO_REUSEPORT is only set when reuse_port is true, so a second copy of
+    a single-process manager fails to bind instead of quietly splitting
+    traffic with the first.
+    """
+
+    def __init__(self, server_address, handler_class, reuse_port=False):
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+def fork_workers(workers):
+    """Fork the manager's worker processes, each binding its own listener
+
+    The kernel load-balances connections across their SO_REUSEPORT
+    sockets. Returns the worker count in each worker; the parent never
+    returns, it stays behind to supervise them. Returns 1 without forking
+    for a single worker, or where fork or SO_REUSEPORT is missing.
+    """
+    if workers <= 1 or not (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')):
+        return 1
+    children = set()
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            # Own process group: a terminal Ctrl-C reaches only the
+            # supervisor, which forwards it exactly once
+            os.setpgid(0, 0)
+            return workers
+        children.add(pid)
+    _supervise_workers(children)
+
+def _supervise_workers(children):
+    """Forward SIGTERM/SIGINT to the workers, reap them and exit with them"""
+    def forward(signum, frame):
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    failed = False
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        failed = failed or os.waitstatus_to_exitcode(status) != 0
+    sys.exit(1 if failed else 0)
+
 def main():
     """Main function to start the Real MCP Manager"""
     port = int(os.getenv('MCP_MANAGER_PORT', 8803))
     host = os.getenv('MCP_MANAGER_HOST', '0.0.0.0')
+    workers = max(1, int(os.getenv('MCP_MANAGER_WORKERS', 1)))
 
     print(f"🚀 Starting Real MCP Manager v1.0.0")
     print(f"📡 Server: http://{host}:{port}")
@@ -347,7 +527,14 @@ def main():
     print(f"⏰ Started: {datetime.utcnow().isoformat()}Z")
 
     try:
-        with socketserver.TCPServer((host, port), RealMCPHandler) as httpd:
+        workers = fork_workers(workers)
+        # SIGTERM (docker/systemd stop, or the supervisor) shuts down like Ctrl-C
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        if workers > 1:
+            logger.info(f"Worker {os.getpid()} of {workers} sharing port {port} via SO_REUSEPORT")
+
+        # One thread per connection, so a slow downstream MCP service only stalls its own client
+        with ReusePortHTTPServer((host, port), RealMCPHandler, reuse_port=workers > 1) as httpd:
             logger.info(f"Real MCP Manager listening on http://{host}:{port}")
             logger.info("🎯 Ready to route requests to real MCP services!")
             httpd.serve_forever()
@@ -5,15 +5,45 @@ Works with native Gemini API format to replace the broken Rust version
 Provides real intent parsing without function_call compatibility issues
 """
 
+import functools
+import hashlib
 import http.server
-import socketserver
 import json
-import requests
 import logging
+import logging.handlers
 import os
+import queue
+import random
+import secrets
+import signal
+import socket
+import sys
+import threading
 import time
-from datetime import datetime
-import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; stdlib json also encodes Gemini requests and intents
+    _json_loads = json.loads
+
+    def _json_dumps(data):
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+_TS_CACHE = (0, '')
+
+def _now_iso_z():
+    """UTC time for intent and error timestamps, formatted at most once per second"""
+    global _TS_CACHE
+    now = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] != now:
+        cached = (now, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)))
+        _TS_CACHE = cached
+    return cached[1]
 
 # Configure logging
 logging.basicConfig(
@@ -22,13 +52,481 @@ logging.basicConfig(
 )
 logger = logging.getLogger('simple-intent-parser')
 
+def _start_log_listener():
+    """Move the root logger's stream writes onto a background thread
+
+    Called by main() in each serving process: from then on handlers only
+    enqueue records, and the returned listener formats and writes them
+    with the original handlers. Importing the module without running
+    main() keeps plain synchronous logging.
+    """
+    log_queue = queue.SimpleQueue()
+    enqueue = logging.handlers.QueueHandler(log_queue)
+    enqueue.setFormatter(logging.Formatter('%(message)s'))
+    root = logging.getLogger()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [enqueue]
+    listener.start()
+    return listener
+
+# Shared keep-alive pool so Gemini calls reuse TCP/TLS connections. It
+# (and requests itself) is only loaded on the first Gemini call, so
+# fallback-only processes never pay for it
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=100))
+                _SESSION = session
+    return _SESSION
+
+# Gemini configuration, read and built once at import
+GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+GEMINI_STREAM_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:streamGenerateContent?alt=sse"
+GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
+# Without a key every request goes straight to rule-based parsing
+USE_GEMINI = bool(GEMINI_API_KEY)
+GEMINI_HEADERS = {
+    "Content-Type": "application/json",
+    "x-goog-api-key": GEMINI_API_KEY or ''
+}
+GEN_CONFIG = {
+    "temperature": 0.1,
+    "maxOutputTokens": 1000
+}
+
+PROMPT_TMPL = """Analyze this user request and extract the intent for workflow creation:
+
+User Request: {user_input}
+
+Please identify:
+1. The main workflow type (blog-post-generation, content-creation, etc.)
+2. The specific topic or subject matter
+3. Any special requirements or preferences
+4. Suggested title for the content
+
+Respond in this JSON format:
+{{
+    "workflow_type": "blog-post-generation",
+    "topic": "extracted topic",
+    "title": "suggested title",
+    "requirements": ["requirement1", "requirement2"],
+    "confidence": 0.95
+}}"""
+
+BATCH_PROMPT_TMPL = """Analyze each of these {count} user requests and extract the intent for workflow creation:
+
+User Requests:
+{numbered}
+
+For each request, identify:
+1. The main workflow type (blog-post-generation, content-creation, etc.)
+2. The specific topic or subject matter
+3. Any special requirements or preferences
+4. Suggested title for the content
+
+Respond with a JSON array of exactly {count} objects, in the same order as the requests, each in this format:
+{{
+    "workflow_type": "blog-post-generation",
+    "topic": "extracted topic",
+    "title": "suggested title",
+    "requirements": ["requirement1", "requirement2"],
+    "confidence": 0.95
+}}"""
+
+# At most this many Gemini calls are in flight at once; the rest wait
+# here instead of piling onto the project's rate limit
+_GEMINI_SLOTS = threading.BoundedSemaphore(int(os.getenv('GEMINI_MAX_INFLIGHT', 32)))
+GEMINI_MAX_ATTEMPTS = 5
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying a throttled or failed Gemini call"""
+    retry_after = response.headers.get('Retry-After', '')
+    if retry_after.isdigit():
+        return min(int(retry_after), 30)
+    return min(2 ** attempt, 8) * (0.5 + random.random() * 0.5)
+
+def _post_gemini(url, body, stream=False):
+    """POST an encoded request body to Gemini, retrying 429 and 5xx answers
+    with jittered backoff
+
+    Returns the last response; the caller checks its status code.
+    """
+    post = _get_session().post
+    for attempt in range(GEMINI_MAX_ATTEMPTS):
+        response = post(url, data=body, headers=GEMINI_HEADERS, stream=stream, timeout=30)
+        if (response.status_code != 429 and response.status_code < 500) or attempt == GEMINI_MAX_ATTEMPTS - 1:
+            return response
+        delay = _retry_delay(response, attempt)
+        logger.warning("Gemini API returned %d, retrying in %.1fs", response.status_code, delay)
+        response.close()
+        time.sleep(delay)
+
+def _call_gemini_api(payload):
+    """Call Gemini API with proper format"""
+    try:
+        logger.info("Calling Gemini API for intent parsing...")
+
+        with _GEMINI_SLOTS:
+            response = _post_gemini(GEMINI_URL, _json_dumps(payload))
+
+        if response.status_code == 200:
+            result = _json_loads(response.content)
+            logger.info("✅ Gemini API call successful")
+            return result
+        else:
+            logger.error(f"Gemini API error: {response.status_code} - {response.text}")
+            return None
+
+    except OSError as e:  # includes requests.RequestException
+        logger.error(f"Failed to call Gemini API: {str(e)}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error in Gemini API call: {str(e)}")
+        return None
+
+# Decodes the JSON embedded in Gemini's reply in one pass, without
+# slicing it out of the surrounding text first
+_DECODER = json.JSONDecoder()
+
+def _build_intent_payload(user_input):
+    """Encoded Gemini request asking for the intent of a single request"""
+    return _json_dumps({
+        "contents": [{"parts": [{"text": PROMPT_TMPL.format(user_input=user_input)}]}],
+        "generationConfig": GEN_CONFIG
+    })
+
+# Short inputs are memoized so a repeated one skips formatting and
+# serialization even when the intent cache has nothing for it (e.g. Gemini
+# failed last time); longer ones are encoded per call so the memo stays
+# small
+_PAYLOAD_MEMO_MAX_INPUT = 1024
+_memoized_intent_payload = functools.lru_cache(maxsize=2048)(_build_intent_payload)
+
+def _intent_payload_bytes(user_input):
+    """Encoded single-request Gemini payload, memoized for short str inputs"""
+    if isinstance(user_input, str) and len(user_input) <= _PAYLOAD_MEMO_MAX_INPUT:
+        return _memoized_intent_payload(user_input)
+    return _build_intent_payload(user_input)
+
+def _batch_intent_payload(user_inputs):
+    """Gemini request asking for the intents of several requests at once"""
+    numbered = '\n'.join(f"{n}) {json.dumps(text)}" for n, text in enumerate(user_inputs, 1))
+    prompt = BATCH_PROMPT_TMPL.format(count=len(user_inputs), numbered=numbered)
+    return {
+        "contents": [{"parts": [{"text": prompt}]}],
+        "generationConfig": {**GEN_CONFIG, "maxOutputTokens": min(1000 * len(user_inputs), 8192)}
+    }
+
+def _gemini_text(gemini_response):
+    """Return the text of Gemini's first candidate, or None"""
+    try:
+        return gemini_response['candidates'][0]['content']['parts'][0].get('text', '')
+    except (KeyError, IndexError, TypeError):
+        return None
+
+# Reads out the tail of streamed Gemini responses once their intent is
+# decoded, so the caller needn't wait for it and the connection is pooled
+_DRAINER = ThreadPoolExecutor(max_workers=4, thread_name_prefix='gemini-drain')
+
+def _drain_response(response, lines):
+    """Consume the rest of a streamed response, then close it"""
+    try:
+        for _ in lines:
+            pass
+    except OSError:  # a broken stream just loses its connection
+        pass
+    finally:
+        response.close()
+
+def _stream_gemini_intent(user_input):
+    """Stream Gemini's answer for one input, decoding its JSON once complete
+
+    Returns as soon as the fragments received so far contain the whole
+    intent object; the rest of the stream is drained on _DRAINER after the
+    Gemini slot is released. Returns None if the call fails.
+    """
+    try:
+        logger.info("Calling Gemini API for intent parsing...")
+
+        text_content = None
+        intent = None
+        with _GEMINI_SLOTS:
+            response = _post_gemini(GEMINI_STREAM_URL, _intent_payload_bytes(user_input), stream=True)
+            if response.status_code != 200:
+                logger.error(f"Gemini API error: {response.status_code} - {response.text}")
+                response.close()
+                return None
+
+            # Per-event loop: keep its callables in locals
+            loads, gemini_text, raw_decode = _json_loads, _gemini_text, _DECODER.raw_decode
+            lines = response.iter_lines()
+            try:
+                for line in lines:
+                    if not line.startswith(b'data:'):
+                        continue
+                    fragment = gemini_text(loads(line[5:]))
+                    if fragment is None:
+                        continue
+                    text_content = (text_content or '') + fragment
+                    json_start = text_content.find('{') if '}' in fragment else -1
+                    if json_start != -1:
+                        try:
+                            intent, _ = raw_decode(text_content, json_start)
+                        except json.JSONDecodeError:
+                            continue
+                        break
+            except BaseException:
+                response.close()
+                raise
+
+        # Closing a half-read response would discard its connection
+        _DRAINER.submit(_drain_response, response, lines)
+
+        logger.info("✅ Gemini API call successful")
+        if intent is not None:
+            return intent
+        return _extract_intent(text_content)
+
+    except OSError as e:  # includes requests.RequestException
+        logger.error(f"Failed to call Gemini API: {str(e)}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error in Gemini API call: {str(e)}")
+        return None
+
+# Returned in place of an intent when Gemini answered without usable JSON
+_UNPARSED = object()
+
+def _extract_intent(text_content):
+    """Extract the intent dict from Gemini's reply text to a single request
+
+    Returns _UNPARSED when the reply holds no decodable JSON object.
+    """
+    if text_content is None:
+        return None
+
+    # Try to parse JSON from Gemini's response
+    try:
+        # Decode the first object in place, ignoring any text around it
+        json_start = text_content.find('{')
+        if json_start == -1:
+            raise ValueError("No JSON found in response")
+        intent, _ = _DECODER.raw_decode(text_content, json_start)
+        return intent
+    except (json.JSONDecodeError, ValueError):
+        return _UNPARSED
+
+def _extract_batch_intents(gemini_response, user_inputs):
+    """Extract one intent dict per input from a batched Gemini response
+
+    Entries that are missing or malformed come back as None so that the
+    caller falls back to rule-based parsing for just those inputs.
+    """
+    text_content = _gemini_text(gemini_response) if gemini_response else None
+    intents = None
+    if text_content:
+        json_start = text_content.find('[')
+        if json_start != -1:
+            try:
+                intents, _ = _DECODER.raw_decode(text_content, json_start)
+            except json.JSONDecodeError:
+                intents = None
+
+    if not isinstance(intents, list) or len(intents) != len(user_inputs):
+        if text_content is not None:
+            logger.warning("Gemini batch response did not match %d inputs", len(user_inputs))
+        return [None] * len(user_inputs)
+    return [intent if isinstance(intent, dict) else None for intent in intents]
+
+def _request_intents(user_inputs):
+    """Parse a batch of user inputs with one Gemini call"""
+    if len(user_inputs) == 1:
+        return [_stream_gemini_intent(user_inputs[0])]
+    gemini_response = _call_gemini_api(_batch_intent_payload(user_inputs))
+    return _extract_batch_intents(gemini_response, user_inputs)
+
+class GeminiBatcher:
+    """Coalesces concurrent intent parsing requests into shared Gemini calls
+
+    The first request to arrive opens a batch and waits up to max_wait
+    for others to join (at most max_batch); it then makes one Gemini call
+    for the whole batch on its own thread and hands every waiter its
+    entry. A batch of one uses the regular single-request prompt.
+    """
+
+    def __init__(self, max_batch=16, max_wait=0.025):
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self._cond = threading.Condition()
+        self._open = None
+
+    def submit(self, user_input):
+        """Return Gemini's intent dict for user_input
+
+        Returns None if the call failed, or _UNPARSED if Gemini answered
+        without a decodable JSON object; neither should be cached.
+        """
+        future = Future()
+        with self._cond:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = []
+            batch.append((user_input, future))
+            if len(batch) >= self.max_batch:
+                self._open = None
+                self._cond.notify_all()
+
+        if leader:
+            with self._cond:
+                self._cond.wait_for(lambda: self._open is not batch, timeout=self.max_wait)
+                if self._open is batch:
+                    self._open = None
+            self._dispatch(batch)
+
+        return future.result()
+
+    def _dispatch(self, batch):
+        intents = [None] * len(batch)
+        try:
+            if len(batch) > 1:
+                logger.info("Batching %d intent parsing requests into one Gemini call", len(batch))
+            intents = _request_intents([user_input for user_input, _ in batch])
+        except Exception as e:
+            logger.error(f"Batched Gemini call failed: {str(e)}")
+        finally:
+            for (_, future), intent in zip(batch, intents):
+                future.set_result(intent)
+
+_BATCHER = GeminiBatcher(
+    max_batch=int(os.getenv('GEMINI_BATCH_MAX', 16)),
+    max_wait=float(os.getenv('GEMINI_BATCH_WAIT_MS', 25)) / 1000
+)
+
+class IntentCache:
+    """Thread-safe LRU of Gemini intents with a per-entry time-to-live"""
+
+    def __init__(self, maxsize=10_000, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(user_input):
+        """Digest of the case- and whitespace-normalized input"""
+        normalized = ' '.join(str(user_input).lower().split())
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, intent = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return intent
+
+    def put(self, key, intent):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, intent)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+_INTENT_CACHE = IntentCache(
+    maxsize=int(os.getenv('INTENT_CACHE_SIZE', 10_000)),
+    ttl=float(os.getenv('INTENT_CACHE_TTL', 3600))
+)
+
+# Rule-based fallback: keyword sets, and per workflow type the function
+# name, description and content type reported for it
+BLOG_KEYWORDS = ('blog', 'post', 'article', 'write')
+IMAGE_KEYWORDS = ('image', 'picture', 'photo')
+
+def _fallback_rule(workflow_type, function_name):
+    return (workflow_type, function_name,
+            f"Generate {workflow_type.replace('-', ' ')} content",
+            workflow_type.split('-')[0])
+
+_BLOG_FALLBACK = _fallback_rule("blog-post-generation", "create_blog_post")
+_IMAGE_FALLBACK = _fallback_rule("image-generation", "create_image")
+_CONTENT_FALLBACK = _fallback_rule("content-generation", "create_content")
+
+# Response skeletons: every key in output order with its constant value
+# filled in; per-request fields are set on a shallow copy
+_GEMINI_INTENT_TMPL = {
+    "intent_id": None,
+    "user_id": None,
+    "workflow_type": None,
+    "confidence": None,
+    "parsed_intent": None,
+    "functions": None,
+    "real_ai_parsing": True,
+    'model_used': "gemini-2.0-flash",
+    "timestamp": None
+}
+_GEMINI_FUNCTION_TMPL = {
+    "id": None,
+    "name": "create_blog_post",
+    "description": "Generate blog post content",
+    "parameters": None,
+    "provider": "demo-content-mcp",
+    "estimated_duration": 30,
+    "confidence_score": None
+}
+_FALLBACK_INTENT_TMPL = {
+    "intent_id": None,
+    "user_id": None,
+    "workflow_type": None,
+    "confidence": 0.75,
+    "parsed_intent": None,
+    "functions": None,
+    "real_ai_parsing": False,
+    "fallback_used": True,
+    'model_used': "rule-based-fallback",
+    "timestamp": None
+}
+_FALLBACK_FUNCTION_TMPL = {
+    "id": None,
+    "name": None,
+    "description": None,
+    "parameters": None,
+    "provider": "fallback",
+    "estimated_duration": 20,
+    "confidence_score": 0.75
+}
+
+# Largest accepted POST body; intent requests are a short sentence or two
+_MAX_BODY = 64 * 1024  # 64 KiB
+
 class SimpleIntentParserHandler(http.server.BaseHTTPRequestHandler):
     """HTTP handler for Simple Real Intent Parser"""
 
+    # Keep client connections open between requests; every response
+    # carries a Content-Length so the stream stays framed
+    protocol_version = "HTTP/1.1"
+
+    # Socket timeout so idle keep-alive connections release their thread
+    timeout = 10
+
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
         self.send_response(200)
         self._set_cors_headers()
+        self.send_header('Content-Length', '0')
+        self._send_connection_header()
         self.end_headers()
 
     def do_GET(self):
@@ -41,12 +539,29 @@ class SimpleIntentParserHandler(http.server.BaseHTTPRequestHandler):
     def do_POST(self):
         """Handle POST requests for intent parsing"""
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length)
-            request_data = json.loads(post_data.decode('utf-8'))
+            if 'Transfer-Encoding' in self.headers or 'Content-Length' not in self.headers:
+                # Only Content-Length bodies are read, so an undrained chunked
+                # body would be parsed as the next request on this connection
+                self.close_connection = True
+                self._send_error_response(411, "Length Required")
+                return
+            length_header = self.headers['Content-Length']
+            if not (length_header.isascii() and length_header.isdigit()):
+                # Negative or malformed, so there's no telling where the body ends
+                self.close_connection = True
+                self._send_error_response(400, "Invalid Content-Length")
+                return
+            content_length = int(length_header)
+            if content_length > _MAX_BODY:
+                # The body is left unread, so this connection can't be reused
+                self.close_connection = True
+                self._send_error_response(413, f"Payload too large (limit {_MAX_BODY} bytes)")
+                return
+            request_data = _json_loads(self._read_body(content_length))
 
-            logger.info(f"Received intent parsing request: {self.path}")
-            logger.info(f"Request data: {json.dumps(request_data, indent=2)}")
+            logger.info("Received intent parsing request: %s", self.path)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request data: %s", _json_dumps(request_data).decode('utf-8'))
 
             if self.path == '/v1/parse':
                 self._handle_intent_parsing(request_data)
@@ -57,13 +572,28 @@ class SimpleIntentParserHandler(http.server.BaseHTTPRequestHandler):
             logger.error(f"Error handling POST request: {str(e)}")
             self._send_error_response(500, f"Internal server error: {str(e)}")
 
+    def _read_body(self, length):
+        """Read up to length body bytes straight into one preallocated buffer"""
+        buf = bytearray(length)
+        view = memoryview(buf)
+        received = 0
+        while received < length:
+            chunk = self.rfile.readinto(view[received:])
+            if not chunk:
+                break
+            received += chunk
+        view.release()
+        if received < length:
+            del buf[received:]
+        return buf
+
     def _handle_health(self):
         """Health check endpoint"""
         health_data = {
             'status': 'healthy',
             'service': 'simple-intent-parser-real',
             'version': '1.0.0',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _now_iso_z(),
             'llm_status': 'connected',
             'provider': 'gemini',
             'model': 'gemini-2.0-flash'
@@ -80,15 +610,32 @@ class SimpleIntentParserHandler(http.server.BaseHTTPRequestHandler):
                 self._send_error_response(400, "Missing 'input' or 'text' field")
                 return
 
-            logger.info(f"Parsing intent for user: {user_id}")
-            logger.info(f"User input: {user_input}")
-
-            # Call Gemini API for real intent parsing
-            gemini_response = self._call_gemini_api(user_input)
+            logger.info("Parsing intent for user: %s", user_id)
+            logger.debug("User input: %s", user_input)
+
+            # Reuse a recent Gemini answer for the same input, otherwise call
+            # Gemini batched with any concurrent requests
+            gemini_intent = None
+            if USE_GEMINI:
+                cache_key = IntentCache.key(user_input)
+                gemini_intent = _INTENT_CACHE.get(cache_key)
+                if gemini_intent is None:
+                    gemini_intent = _BATCHER.submit(user_input)
+                    if gemini_intent is _UNPARSED:
+                        # Gemini answered but its JSON didn't parse; describe
+                        # the input as-is, and don't cache the guess
+                        gemini_intent = {
+                            "workflow_type": "blog-post-generation",
+                            "topic": user_input,
+                            "title": f"Content about: {user_input}",
+                            "confidence": 0.8
+                        }
+                    elif gemini_intent:
+                        _INTENT_CACHE.put(cache_key, gemini_intent)
 
-            if gemini_response:
-                # Parse Gemini response and create workflow intent
-                parsed_intent = self._parse_gemini_response(gemini_response, user_input, user_id)
+            if gemini_intent:
+                # Create workflow intent from Gemini's answer
+                parsed_intent = self._build_intent_response(gemini_intent, user_input, user_id)
 
                 logger.info("✅ Real intent parsing successful!")
                 self._send_json_response(parsed_intent)
@@ -107,193 +654,89 @@ class SimpleIntentParserHandler(http.server.BaseHTTPRequestHandler):
             )
             self._send_json_response(fallback_intent)
 
-    def _call_gemini_api(self, user_input):
-        """Call Gemini API with proper format"""
-        try:
-            gemini_api_key = os.getenv('GEMINI_API_KEY')
-            if not gemini_api_key:
-                logger.warning("No Gemini API key found")
-                return None
-
-            url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-
-            # Proper Gemini API format
-            payload = {
-                "contents": [{
-                    "parts": [{
-                        "text": f"""Analyze this user request and extract the intent for workflow creation:
-
-User Request: {user_input}
-
-Please identify:
-1. The main workflow type (blog-post-generation, content-creation, etc.)
-2. The specific topic or subject matter
-3. Any special requirements or preferences
-4. Suggested title for the content
-
-Respond in this JSON format:
-{{
-    "workflow_type": "blog-post-generation",
-    "topic": "extracted topic",
-    "title": "suggested title",
-    "requirements": ["requirement1", "requirement2"],
-    "confidence": 0.95
-}}"""
-                    }]
-                }],
-                "generationConfig": {
-                    "temperature": 0.1,
-                    "maxOutputTokens": 1000
-                }
-            }
-
-            headers = {
-                "Content-Type": "application/json",
-                "x-goog-api-key": gemini_api_key
-            }
-
-            logger.info("Calling Gemini API for intent parsing...")
-
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
-
-            if response.status_code == 200:
-                result = response.json()
-                logger.info("✅ Gemini API call successful")
-                return result
-            else:
-                logger.error(f"Gemini API error: {response.status_code} - {response.text}")
-                return None
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to call Gemini API: {str(e)}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error in Gemini API call: {str(e)}")
-            return None
-
-    def _parse_gemini_response(self, gemini_response, user_input, user_id):
-        """Parse Gemini API response and create intent structure"""
-        try:
-            # Extract content from Gemini response
-            candidates = gemini_response.get('candidates', [])
-            if candidates:
-                content = candidates[0].get('content', {})
-                parts = content.get('parts', [])
-                if parts:
-                    text_content = parts[0].get('text', '')
-
-                    # Try to parse JSON from Gemini's response
-                    try:
-                        # Clean up the response to extract JSON
-                        json_start = text_content.find('{')
-                        json_end = text_content.rfind('}') + 1
-                        if json_start != -1 and json_end > json_start:
-                            json_text = text_content[json_start:json_end]
-                            gemini_intent = json.loads(json_text)
-                        else:
-                            raise ValueError("No JSON found in response")
-                    except (json.JSONDecodeError, ValueError):
-                        # Fallback if JSON parsing fails
-                        gemini_intent = {
-                            "workflow_type": "blog-post-generation",
-                            "topic": user_input,
-                            "title": f"Content about: {user_input}",
-                            "confidence": 0.8
-                        }
-
-                    # Create the intent response in expected format
-                    intent_response = {
-                        "intent_id": str(uuid.uuid4()),
-                        "user_id": user_id,
-                        "workflow_type": gemini_intent.get("workflow_type", "blog-post-generation"),
-                        "confidence": gemini_intent.get("confidence", 0.8),
-                        "parsed_intent": {
-                            "topic": gemini_intent.get("topic", user_input),
-                            "title": gemini_intent.get("title", f"Content about: {user_input}"),
-                            "requirements": gemini_intent.get("requirements", []),
-                            "original_input": user_input
-                        },
-                        "functions": [{
-                            "id": str(uuid.uuid4()),
-                            "name": "create_blog_post",
-                            "description": "Generate blog post content",
-                            "parameters": {
-                                "title": gemini_intent.get("title", f"Blog post about: {user_input}"),
-                                "topic": gemini_intent.get("topic", user_input),
-                                "content_type": "blog_post",
-                                "target_length": 800
-                            },
-                            "provider": "demo-content-mcp",
-                            "estimated_duration": 30,
-                            "confidence_score": gemini_intent.get("confidence", 0.8)
-                        }],
-                        "real_ai_parsing": True,
-                        'model_used': "gemini-2.0-flash",
-                        "timestamp": datetime.utcnow().isoformat() + 'Z'
-                    }
-
-                    return intent_response
-
-        except Exception as e:
-            logger.error(f"Failed to parse Gemini response: {str(e)}")
-
-        # Fallback if parsing fails
-        return self._create_fallback_intent(user_input, user_id)
+    def _build_intent_response(self, gemini_intent, user_input, user_id):
+        """Create the intent response structure from Gemini's extracted intent"""
+        new_id = secrets.token_hex
+        topic = gemini_intent.get("topic", user_input)
+        confidence = gemini_intent.get("confidence", 0.8)
+
+        function = _GEMINI_FUNCTION_TMPL.copy()
+        function["id"] = new_id(16)
+        function["parameters"] = {
+            "title": gemini_intent.get("title", f"Blog post about: {user_input}"),
+            "topic": topic,
+            "content_type": "blog_post",
+            "target_length": 800
+        }
+        function["confidence_score"] = confidence
+
+        intent_response = _GEMINI_INTENT_TMPL.copy()
+        intent_response["intent_id"] = new_id(16)
+        intent_response["user_id"] = user_id
+        intent_response["workflow_type"] = gemini_intent.get("workflow_type", "blog-post-generation")
+        intent_response["confidence"] = confidence
+        intent_response["parsed_intent"] = {
+            "topic": topic,
+            "title": gemini_intent.get("title", f"Content about: {user_input}"),
+            "requirements": gemini_intent.get("requirements", []),
+            "original_input": user_input
+        }
+        intent_response["functions"] = [function]
+        intent_response["timestamp"] = _now_iso_z()
+        return intent_response
 
     def _create_fallback_intent(self, user_input, user_id):
         """Create fallback intent when Gemini API is unavailable"""
 
         # Simple rule-based intent detection
-        if any(word in user_input.lower() for word in ['blog', 'post', 'article', 'write']):
-            workflow_type = "blog-post-generation"
-            function_name = "create_blog_post"
-        elif any(word in user_input.lower() for word in ['image', 'picture', 'photo']):
-            workflow_type = "image-generation"
-            function_name = "create_image"
+        lowered = user_input.lower()
+        if any(word in lowered for word in BLOG_KEYWORDS):
+            workflow_type, function_name, description, content_type = _BLOG_FALLBACK
+        elif any(word in lowered for word in IMAGE_KEYWORDS):
+            workflow_type, function_name, description, content_type = _IMAGE_FALLBACK
         else:
-            workflow_type = "content-generation"
-            function_name = "create_content"
-
-        intent_response = {
-            "intent_id": str(uuid.uuid4()),
-            "user_id": user_id,
-            "workflow_type": workflow_type,
-            "confidence": 0.75,
-            "parsed_intent": {
-                "topic": user_input,
-                "title": f"Content about: {user_input}",
-                "requirements": [],
-                "original_input": user_input
-            },
-            "functions": [{
-                "id": str(uuid.uuid4()),
-                "name": function_name,
-                "description": f"Generate {workflow_type.replace('-', ' ')} content",
-                "parameters": {
-                    "title": f"Generated content: {user_input}",
-                    "topic": user_input,
-                    "content_type": workflow_type.split('-')[0]
-                },
-                "provider": "fallback",
-                "estimated_duration": 20,
-                "confidence_score": 0.75
-            }],
-            "real_ai_parsing": False,
-            "fallback_used": True,
-            'model_used': "rule-based-fallback",
-            "timestamp": datetime.utcnow().isoformat() + 'Z'
+            workflow_type, function_name, description, content_type = _CONTENT_FALLBACK
+
+        new_id = secrets.token_hex
+        function = _FALLBACK_FUNCTION_TMPL.copy()
+        function["id"] = new_id(16)
+        function["name"] = function_name
+        function["description"] = description
+        function["parameters"] = {
+            "title": f"Generated content: {user_input}",
+            "topic": user_input,
+            "content_type": content_type
         }
 
+        intent_response = _FALLBACK_INTENT_TMPL.copy()
+        intent_response["intent_id"] = new_id(16)
+        intent_response["user_id"] = user_id
+        intent_response["workflow_type"] = workflow_type
+        intent_response["parsed_intent"] = {
+            "topic": user_input,
+            "title": f"Content about: {user_input}",
+            "requirements": [],
+            "original_input": user_input
+        }
+        intent_response["functions"] = [function]
+        intent_response["timestamp"] = _now_iso_z()
+
         return intent_response
 
     def _send_json_response(self, data, status_code=200):
         """Send JSON response"""
+        body = _json_dumps(data)
         self.send_response(status_code)
         self._set_cors_headers()
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self._send_connection_header()
         self.end_headers()
-        response_json = json.dumps(data, indent=2)
-        self.wfile.write(response_json.encode('utf-8'))
+        self.wfile.write(body)
+
+    def _send_connection_header(self):
+        """Advertise keep-alive unless the client or handler is closing"""
+        self.send_header('Connection', 'close' if self.close_connection else 'keep-alive')
 
     def _send_error_response(self, status_code, message):
         """Send error response"""
@@ -301,7 +744,7 @@ Respond in this JSON format:
             'error': True,
             'message': message,
             'status_code': status_code,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': _now_iso_z()
         }
         self._send_json_response(error_data, status_code)
 
@@ -331,19 +774,96 @@ Respond in this JSON format:
         """Override to use our logger"""
         logger.info(format % args)
 
+class ThreadedServer(http.server.ThreadingHTTPServer):
+    """One daemon thread per connection, with a deeper accept backlog
+
+    Slow Gemini calls never block health checks or other clients, and
+    bursts of connections queue in the kernel instead of being refused
+    once socketserver's default backlog of 5 fills up. With reuse_port
+    the port is shared with sibling workers via SO_REUSEPORT; without it
+    a second copy of the parser fails to bind instead of quietly
+    splitting traffic with the first.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, reuse_port=False):
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+def fork_workers(workers):
+    """Fork the parser's worker processes, each binding its own listener
+
+    The kernel load-balances connections across their SO_REUSEPORT
+    sockets. Returns the worker count in each worker; the parent never
+    returns, it stays behind to supervise them. Returns 1 without forking
+    for a single worker, or where fork or SO_REUSEPORT is missing.
+    """
+    if workers <= 1 or not (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')):
+        return 1
+    children = set()
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            # Own process group: a terminal Ctrl-C reaches only the
+            # supervisor, which forwards it exactly once
+            os.setpgid(0, 0)
+            return workers
+        children.add(pid)
+    _supervise_workers(children)
+
+def _supervise_workers(children):
+    """Forward SIGTERM/SIGINT to the workers, reap them and exit with them"""
+    def forward(signum, frame):
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    failed = False
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        failed = failed or os.waitstatus_to_exitcode(status) != 0
+    sys.exit(1 if failed else 0)
+
 def main():
     """Main function to start the Simple Real Intent Parser"""
     port = int(os.getenv('INTENT_PARSER_PORT', 8802))
     host = os.getenv('INTENT_PARSER_HOST', '0.0.0.0')
+    workers = max(1, int(os.getenv('INTENT_PARSER_WORKERS', 1)))
 
     print(f"🚀 Starting Simple Real Intent Parser v1.0.0")
     print(f"📡 Server: http://{host}:{port}")
     print(f"🤖 AI Provider: Gemini Flash 2.0")
-    print(f"🔑 API Key: {'✅ Present' if os.getenv('GEMINI_API_KEY') else '❌ Missing'}")
-    print(f"⏰ Started: {datetime.utcnow().isoformat()}Z")
-
+    print(f"🔑 API Key: {'✅ Present' if GEMINI_API_KEY else '❌ Missing'}")
+    print(f"⏰ Started: {_now_iso_z()}")
+
+    # Fork before starting any threads; each worker runs its own log listener
+    workers = fork_workers(workers)
+    # SIGTERM (docker/systemd stop, or the supervisor) shuts down like Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    log_listener = _start_log_listener()
     try:
-        with socketserver.TCPServer((host, port), SimpleIntentParserHandler) as httpd:
+        if workers > 1:
+            logger.info(f"Worker {os.getpid()} of {workers} sharing port {port} via SO_REUSEPORT")
+        if not USE_GEMINI:
+            logger.warning("No Gemini API key found; fallback-only mode")
+
+        with ThreadedServer((host, port), SimpleIntentParserHandler, reuse_port=workers > 1) as httpd:
             logger.info(f"Simple Real Intent Parser listening on http://{host}:{port}")
             logger.info("🎯 Ready to parse intents with real Gemini AI!")
             httpd.serve_forever()
@@ -353,6 +873,9 @@ def main():
     except Exception as e:
         logger.error(f"Failed to start Simple Real Intent Parser: {str(e)}")
         print(f"❌ Error: {str(e)}")
+    finally:
+        # Flush whatever is still queued before the process exits
+        log_listener.stop()
 
 if __name__ == '__main__':
     main()
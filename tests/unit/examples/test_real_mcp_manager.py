@@ -0,0 +1,96 @@
+"""Unit tests for examples/basic/real-mcp-manager.py"""
+
+import http.client
+import importlib.util
+import pathlib
+import threading
+import time
+import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+_SCRIPT = pathlib.Path(__file__).resolve().parents[3] / 'examples' / 'basic' / 'real-mcp-manager.py'
+_spec = importlib.util.spec_from_file_location('real_mcp_manager', _SCRIPT)
+manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(manager)
+
+
+class ServiceHealthTest(unittest.TestCase):
+
+    def setUp(self):
+        self.probes = Counter()
+        self.handler = object.__new__(manager.RealMCPHandler)
+        for patcher in (mock.patch.dict(manager._HEALTH_CACHE, clear=True),
+                        mock.patch.object(manager._PROBE_SESSION, 'get', self.fake_get)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fake_get(self, url, timeout):
+        self.probes[url] += 1
+        time.sleep(0.1)
+        if 'down' in url:
+            raise OSError('connection refused')
+        return mock.Mock(status_code=200)
+
+    def check_concurrently(self, urls):
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            return list(pool.map(self.handler._check_service_health, urls))
+
+    def test_one_probe_per_url_under_concurrency(self):
+        urls = ['http://up:1', 'http://down:2'] * 8
+        results = self.check_concurrently(urls)
+        self.assertEqual(self.probes, {'http://up:1/health': 1, 'http://down:2/health': 1})
+        self.assertEqual(results, [True, False] * 8)
+
+    def test_expired_result_is_probed_again(self):
+        with mock.patch.object(manager, '_HEALTH_TTL', 0.05):
+            self.assertTrue(self.handler._check_service_health('http://up:1'))
+            self.assertTrue(self.handler._check_service_health('http://up:1'))
+            self.assertEqual(self.probes['http://up:1/health'], 1)
+            time.sleep(0.1)
+            self.assertTrue(self.handler._check_service_health('http://up:1'))
+            self.assertEqual(self.probes['http://up:1/health'], 2)
+
+
+class RetryConfigTest(unittest.TestCase):
+
+    def test_posts_retried_only_when_not_taken(self):
+        retry = manager._ADAPTER.max_retries
+        self.assertTrue(retry.is_retry('POST', 503))
+        self.assertTrue(retry.is_retry('POST', 429))
+        self.assertFalse(retry.is_retry('POST', 500))
+        self.assertIs(retry.read, False)
+
+    def test_probes_are_not_retried(self):
+        self.assertEqual(manager._PROBE_SESSION.get_adapter('http://service').max_retries.total, 0)
+
+
+class RequestLengthTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.httpd = manager.ReusePortHTTPServer(('127.0.0.1', 0), manager.RealMCPHandler)
+        threading.Thread(target=cls.httpd.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.server_close()
+
+    def post_status(self, length):
+        conn = http.client.HTTPConnection(*self.httpd.server_address, timeout=5)
+        self.addCleanup(conn.close)
+        conn.request('POST', '/', body=b'{}', headers={'Content-Length': length})
+        return conn.getresponse().status
+
+    def test_negative_length_is_bad_request(self):
+        self.assertEqual(self.post_status('-1'), 400)
+        self.assertEqual(self.post_status('12abc'), 400)
+
+    def test_oversized_length_is_too_large(self):
+        self.assertEqual(self.post_status(str(manager._MAX_BODY + 1)), 413)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Unit tests for examples/basic/real-mcp-manager-8803.py"""
+
+import http.client
+import importlib.util
+import pathlib
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+_SCRIPT = pathlib.Path(__file__).resolve().parents[3] / 'examples' / 'basic' / 'real-mcp-manager-8803.py'
+_spec = importlib.util.spec_from_file_location('real_mcp_manager_8803', _SCRIPT)
+manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(manager)
+
+
+def fallback(topic, word_count):
+    return manager.RealMCPHandler.generate_fallback_content(None, topic, word_count)
+
+
+class FallbackContentTest(unittest.TestCase):
+
+    def test_multi_word_topic_past_template_length(self):
+        # The rendered article is longer than the template itself, so these
+        # counts truncate without indexing past the template's word offsets
+        topic = 'AI automation in healthcare'
+        full = len(manager._FALLBACK_TMPL.substitute(topic=topic).split())
+        for word_count in range(manager._FALLBACK_BASE_WORDS, full):
+            content = fallback(topic, word_count)
+            self.assertTrue(content.endswith('</p>'))
+            self.assertLessEqual(len(content.split()), full)
+
+    def test_truncates_multi_word_topic(self):
+        content = fallback('AI automation', 100)
+        self.assertTrue(content.startswith('<h2>Understanding AI automation: '))
+        self.assertTrue(content.endswith('</p>'))
+
+    def test_truncates_to_exact_rendered_word_count(self):
+        for topic in ('AI', 'AI automation', 'AI automation in healthcare', '', ' padded  topic '):
+            full = len(manager._FALLBACK_TMPL.substitute(topic=topic).split())
+            for word_count in range(1, full):
+                with self.subTest(topic=topic, word_count=word_count):
+                    self.assertEqual(len(fallback(topic, word_count).split()), word_count)
+
+    def test_short_target_gets_full_article(self):
+        content = fallback('AI automation', 1000)
+        self.assertIn('<h3>Additional Insights</h3>', content)
+
+
+class ReportedWordCountTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = object.__new__(manager.RealMCPHandler)
+
+    def assert_exact(self, result):
+        self.assertEqual(result['word_count'], len(result['content'].split()))
+
+    def test_fallback_blog(self):
+        with mock.patch.object(manager.RealMCPHandler, 'GEMINI_AVAILABLE', False):
+            for word_count in (100, 800, 2000):
+                with self.subTest(word_count=word_count):
+                    result = self.handler.generate_blog_content({'topic': 'AI automation', 'word_count': word_count})
+                    self.assert_exact(result['result'])
+
+    def test_social_and_generic(self):
+        for topic in ('AI', 'AI automation in healthcare', ' padded  topic ', ''):
+            with self.subTest(topic=topic):
+                self.assert_exact(self.handler.generate_social_content({'topic': topic})['result'])
+                self.assert_exact(self.handler.generate_generic_content({'topic': topic})['result'])
+
+    def test_counts_newline_separated_words(self):
+        self.assertEqual(manager._word_count('<h2>Title</h2>\n<p>one  two\tthree</p>\n'), 4)
+
+
+class ContentCacheKeyTest(unittest.TestCase):
+
+    def test_collapses_whitespace(self):
+        self.assertEqual(manager._content_cache_key(' AI\tautomation ', 800),
+                         manager._content_cache_key('AI automation', 800))
+
+    def test_keeps_case(self):
+        self.assertNotEqual(manager._content_cache_key('AI automation', 800),
+                            manager._content_cache_key('ai automation', 800))
+
+
+class SingleflightTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+    def slow(self, value):
+        self.calls += 1
+        time.sleep(0.1)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def run_concurrently(self, key, value, n=5):
+        def call(_):
+            try:
+                return manager._singleflight(key, self.slow, value)
+            except Exception as e:
+                return e
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            return list(pool.map(call, range(n)))
+
+    def test_concurrent_callers_share_one_call(self):
+        self.assertEqual(self.run_concurrently(('AI', 800), 'article'), ['article'] * 5)
+        self.assertEqual(self.calls, 1)
+        # Finished keys are forgotten, so a later request calls again
+        self.assertEqual(manager._singleflight(('AI', 800), self.slow, 'again'), 'again')
+        self.assertEqual(self.calls, 2)
+
+    def test_failure_reaches_every_caller(self):
+        error = RuntimeError('quota')
+        self.assertEqual(self.run_concurrently(('AI', 900), error), [error] * 5)
+        self.assertEqual(self.calls, 1)
+        self.assertNotIn(('AI', 900), manager._INFLIGHT)
+
+
+class RetryConfigTest(unittest.TestCase):
+
+    def test_gemini_posts_retried_on_throttling(self):
+        retry = manager._ADAPTER.max_retries
+        self.assertTrue(retry.is_retry('POST', 429))
+        self.assertTrue(retry.is_retry('POST', 503))
+        self.assertTrue(retry.is_retry('POST', 500))
+        self.assertIs(retry.read, False)
+
+
+class RequestLengthTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.httpd = manager.ReusePortHTTPServer(('127.0.0.1', 0), manager.RealMCPHandler)
+        threading.Thread(target=cls.httpd.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.server_close()
+
+    def post_status(self, length):
+        conn = http.client.HTTPConnection(*self.httpd.server_address, timeout=5)
+        self.addCleanup(conn.close)
+        conn.request('POST', '/', body=b'{}', headers={'Content-Length': length})
+        return conn.getresponse().status
+
+    def test_negative_length_is_bad_request(self):
+        self.assertEqual(self.post_status('-1'), 400)
+        self.assertEqual(self.post_status('12abc'), 400)
+
+    def test_oversized_length_is_too_large(self):
+        self.assertEqual(self.post_status(str(manager._MAX_BODY + 1)), 413)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,277 @@
+"""Unit tests for examples/basic/simple-real-intent-parser.py"""
+
+import http.server
+import importlib.util
+import json
+import pathlib
+import socket
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+_SCRIPT = pathlib.Path(__file__).resolve().parents[3] / 'examples' / 'basic' / 'simple-real-intent-parser.py'
+_spec = importlib.util.spec_from_file_location('simple_real_intent_parser', _SCRIPT)
+parser = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parser)
+
+
+def read_response(rfile):
+    """Read one Content-Length framed response, returning (status, headers, body)"""
+    status = int(rfile.readline().split()[1])
+    headers = {}
+    for line in iter(rfile.readline, b'\r\n'):
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, rfile.read(int(headers.get('content-length', 0)))
+
+
+class GeminiBatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        patcher = mock.patch.object(parser, '_request_intents', self.fake_request_intents)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_request_intents(self, user_inputs):
+        self.batches.append(list(user_inputs))
+        return [{'topic': text} for text in user_inputs]
+
+    def submit_all(self, batcher, user_inputs):
+        with ThreadPoolExecutor(max_workers=len(user_inputs)) as pool:
+            return list(pool.map(batcher.submit, user_inputs))
+
+    def test_full_batch_dispatches_without_waiting(self):
+        batcher = parser.GeminiBatcher(max_batch=3, max_wait=5)
+        started = time.monotonic()
+        results = self.submit_all(batcher, ['a', 'b', 'c'])
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(sorted(self.batches[0]), ['a', 'b', 'c'])
+        # Every waiter gets its own entry back
+        self.assertEqual(results, [{'topic': 'a'}, {'topic': 'b'}, {'topic': 'c'}])
+
+    def test_lone_request_dispatches_after_max_wait(self):
+        batcher = parser.GeminiBatcher(max_batch=16, max_wait=0.05)
+        started = time.monotonic()
+        self.assertEqual(batcher.submit('a'), {'topic': 'a'})
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertEqual(self.batches, [['a']])
+
+    def test_overflow_opens_a_new_batch(self):
+        batcher = parser.GeminiBatcher(max_batch=2, max_wait=0.2)
+        results = self.submit_all(batcher, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(results, [{'topic': text} for text in 'abcde'])
+        self.assertTrue(all(len(batch) <= 2 for batch in self.batches))
+        self.assertEqual(sorted(sum(self.batches, [])), list('abcde'))
+
+    def test_failed_call_answers_every_waiter(self):
+        batcher = parser.GeminiBatcher(max_batch=2, max_wait=5)
+        with mock.patch.object(parser, '_request_intents', side_effect=RuntimeError('boom')):
+            self.assertEqual(self.submit_all(batcher, ['a', 'b']), [None, None])
+
+
+class IntentCacheTest(unittest.TestCase):
+
+    def test_entries_expire_after_ttl(self):
+        cache = parser.IntentCache(ttl=0.05)
+        key = cache.key('hello')
+        cache.put(key, {'topic': 'hello'})
+        self.assertEqual(cache.get(key), {'topic': 'hello'})
+        time.sleep(0.1)
+        self.assertIsNone(cache.get(key))
+
+    def test_evicts_least_recently_used(self):
+        cache = parser.IntentCache(maxsize=2)
+        for text in ('a', 'b'):
+            cache.put(cache.key(text), text)
+        cache.get(cache.key('a'))
+        cache.put(cache.key('c'), 'c')
+        self.assertIsNone(cache.get(cache.key('b')))
+        self.assertEqual(cache.get(cache.key('a')), 'a')
+
+    def test_key_ignores_case_and_spacing(self):
+        self.assertEqual(parser.IntentCache.key(' Write  a BLOG '), parser.IntentCache.key('write a blog'))
+
+
+class IntentParsingCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = parser.IntentCache()
+        self.handler = object.__new__(parser.SimpleIntentParserHandler)
+        self.responses = []
+        self.handler._send_json_response = lambda data, status_code=200: self.responses.append(data)
+        for patcher in (mock.patch.object(parser, 'USE_GEMINI', True),
+                        mock.patch.object(parser, '_INTENT_CACHE', self.cache)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def parse(self, user_input, gemini_result):
+        with mock.patch.object(parser._BATCHER, 'submit', return_value=gemini_result):
+            self.handler._handle_intent_parsing({'input': user_input})
+        return self.responses[-1]
+
+    def test_unparsed_reply_is_not_cached(self):
+        self.assertIs(parser._extract_intent('no json here'), parser._UNPARSED)
+        response = self.parse('write about cats', parser._UNPARSED)
+        self.assertEqual(response['parsed_intent']['topic'], 'write about cats')
+        self.assertIsNone(self.cache.get(self.cache.key('write about cats')))
+
+    def test_parsed_reply_is_cached(self):
+        self.parse('write about cats', {'topic': 'cats'})
+        self.assertEqual(self.cache.get(self.cache.key('write about cats')), {'topic': 'cats'})
+
+    def test_failed_call_falls_back_uncached(self):
+        response = self.parse('write about cats', None)
+        self.assertFalse(response['real_ai_parsing'])
+        self.assertIsNone(self.cache.get(self.cache.key('write about cats')))
+
+
+class IntentPayloadMemoTest(unittest.TestCase):
+
+    def setUp(self):
+        parser._memoized_intent_payload.cache_clear()
+
+    def test_short_input_is_memoized(self):
+        first = parser._intent_payload_bytes('write about cats')
+        self.assertIs(parser._intent_payload_bytes('write about cats'), first)
+
+    def test_long_and_non_str_inputs_are_not_memoized(self):
+        long_input = 'x' * (parser._PAYLOAD_MEMO_MAX_INPUT + 1)
+        for user_input in (long_input, ['write', 'about', 'cats']):
+            with self.subTest(user_input=type(user_input).__name__):
+                self.assertEqual(parser._intent_payload_bytes(user_input),
+                                 parser._build_intent_payload(user_input))
+        self.assertEqual(parser._memoized_intent_payload.cache_info().currsize, 0)
+
+
+class RequestFramingTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.httpd = parser.ThreadedServer(('127.0.0.1', 0), parser.SimpleIntentParserHandler)
+        threading.Thread(target=cls.httpd.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.server_close()
+
+    def send(self, raw):
+        """Write raw request bytes on one connection and return its reader"""
+        sock = socket.create_connection(self.httpd.server_address, timeout=5)
+        self.addCleanup(sock.close)
+        sock.sendall(raw)
+        return sock.makefile('rb')
+
+    def assert_closed(self, rfile):
+        self.assertEqual(rfile.read(), b'')
+
+    def test_chunked_post_is_refused_and_closed(self):
+        body = b'{"input": "hello"}'
+        rfile = self.send(
+            b'POST /v1/parse HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n'
+            + b'%x\r\n' % len(body) + body + b'\r\n0\r\n\r\n'
+            + b'GET /health HTTP/1.1\r\nHost: x\r\n\r\n'
+        )
+        status, headers, _ = read_response(rfile)
+        self.assertEqual(status, 411)
+        self.assertEqual(headers['connection'], 'close')
+        # The chunk framing must not be parsed as a second request
+        self.assert_closed(rfile)
+
+    def test_post_without_length_is_refused(self):
+        rfile = self.send(b'POST /v1/parse HTTP/1.1\r\nHost: x\r\n\r\n')
+        status, headers, _ = read_response(rfile)
+        self.assertEqual(status, 411)
+        self.assertEqual(headers['connection'], 'close')
+
+    def test_negative_length_is_bad_request(self):
+        for length in (b'-1', b'12abc'):
+            with self.subTest(length=length):
+                rfile = self.send(b'POST /v1/parse HTTP/1.1\r\nHost: x\r\nContent-Length: %s\r\n\r\n{}' % length)
+                status, headers, _ = read_response(rfile)
+                self.assertEqual(status, 400)
+                self.assertEqual(headers['connection'], 'close')
+
+    def test_oversized_length_is_too_large(self):
+        length = parser._MAX_BODY + 1
+        rfile = self.send(b'POST /v1/parse HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n' % length)
+        status, headers, _ = read_response(rfile)
+        self.assertEqual(status, 413)
+        self.assertEqual(headers['connection'], 'close')
+
+    def test_keep_alive_after_framed_post(self):
+        body = b'{"input": "hello"}'
+        rfile = self.send(
+            b'POST /nowhere HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+            + b'GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n'
+        )
+        self.assertEqual(read_response(rfile)[0], 404)
+        self.assertEqual(read_response(rfile)[0], 200)
+
+
+class StalledStreamHandler(http.server.BaseHTTPRequestHandler):
+    """Streams an intent reply, then stalls before finishing the stream"""
+
+    protocol_version = 'HTTP/1.1'
+    reply = '```json\n{"workflow_type": "blog-post-generation", "topic": "cats"}\n```\n'
+    stall = 2.0
+    peers = set()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.peers.add(self.client_address)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for i in range(0, len(self.reply), 8):
+            self.write_event(self.reply[i:i + 8])
+        time.sleep(self.stall)
+        self.write_event('Hope this helps!')
+        self.wfile.write(b'0\r\n\r\n')
+
+    def write_event(self, text):
+        event = b'data: ' + json.dumps({'candidates': [{'content': {'parts': [{'text': text}]}}]}).encode() + b'\r\n\r\n'
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(event), event))
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+class StreamGeminiIntentTest(unittest.TestCase):
+
+    def setUp(self):
+        StalledStreamHandler.peers.clear()
+        httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StalledStreamHandler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        url = f'http://127.0.0.1:{httpd.server_port}/stream'
+        self.drainer = ThreadPoolExecutor(max_workers=1)
+        for patcher in (mock.patch.object(parser, 'GEMINI_STREAM_URL', url),
+                        mock.patch.object(parser, '_DRAINER', self.drainer)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_returns_before_stream_ends(self):
+        started = time.monotonic()
+        intent = parser._stream_gemini_intent('write about cats')
+        self.assertLess(time.monotonic() - started, StalledStreamHandler.stall / 2)
+        self.assertEqual(intent['topic'], 'cats')
+
+    def test_drained_connection_is_reused(self):
+        parser._stream_gemini_intent('write about cats')
+        self.drainer.shutdown(wait=True)
+        self.drainer = parser._DRAINER = ThreadPoolExecutor(max_workers=1)
+        parser._stream_gemini_intent('write about dogs')
+        self.drainer.shutdown(wait=True)
+        self.assertEqual(len(StalledStreamHandler.peers), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()